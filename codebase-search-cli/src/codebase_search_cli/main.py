@@ -1,7 +1,8 @@
 """Main CLI application using Typer."""
 
+import json
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import typer
 from rich.console import Console
@@ -9,7 +10,9 @@ from rich.panel import Panel
 from rich.table import Table
 
 from .config import Config
-from .gemini_client import GeminiSearchClient
+
+if TYPE_CHECKING:
+    from .gemini_client import GeminiSearchClient
 
 app = typer.Typer(
     name="codebase-search",
@@ -29,10 +32,21 @@ def get_config() -> Config:
         raise typer.Exit(1)
 
 
-def get_client() -> GeminiSearchClient:
-    """Get configured Gemini client."""
-    config = get_config()
-    return GeminiSearchClient(config)
+def get_client(config: Optional[Config] = None) -> "GeminiSearchClient":
+    """Get configured Gemini client.
+
+    The Gemini SDK is imported here rather than at module level, since it
+    dominates CLI start-up and commands like ``info`` and ``--help`` never use it.
+
+    Args:
+        config: Configuration to use. If None, loads it from the environment.
+
+    Returns:
+        GeminiSearchClient instance
+    """
+    from .gemini_client import GeminiSearchClient
+
+    return GeminiSearchClient(config or get_config())
 
 
 @app.command()
@@ -49,7 +63,7 @@ def init(
         raise typer.Exit(0)
 
     try:
-        client = GeminiSearchClient(config)
+        client = get_client(config)
 
         # Delete old store if force is enabled
         if force and config.file_search_store_name:
@@ -108,7 +122,7 @@ def index(
         raise typer.Exit(1)
 
     try:
-        client = GeminiSearchClient(config)
+        client = get_client(config)
 
         # Collect files to index
         files_to_index: List[Path] = []
@@ -236,7 +250,7 @@ def search(
         raise typer.Exit(1)
 
     try:
-        client = GeminiSearchClient(config)
+        client = get_client(config)
 
         # Build metadata filter if needed
         metadata_filter = None
@@ -283,7 +297,11 @@ def search(
 
 
 @app.command()
-def list_files() -> None:
+def list_files(
+    json_output: bool = typer.Option(
+        False, "--json", help="Print the file list as JSON instead of a table"
+    ),
+) -> None:
     """List all files in the current file search store."""
     config = get_config()
 
@@ -292,9 +310,14 @@ def list_files() -> None:
         raise typer.Exit(1)
 
     try:
-        client = GeminiSearchClient(config)
+        client = get_client(config)
         files = client.list_files(config.file_search_store_name)
 
+        # Scripting path: plain JSON on stdout, no Rich rendering
+        if json_output:
+            typer.echo(json.dumps(files))
+            return
+
         if not files:
             console.print("[yellow]No files indexed yet.[/yellow]")
             raise typer.Exit(0)
@@ -362,7 +385,7 @@ def clear(
             raise typer.Exit(0)
 
     try:
-        client = GeminiSearchClient(config)
+        client = get_client(config)
         client.delete_store(config.file_search_store_name)
 
         # Clear from .env
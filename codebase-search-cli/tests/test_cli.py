@@ -1,5 +1,6 @@
 """Unit tests for CLI commands."""
 
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -175,6 +176,31 @@ def test_list_files_command(mock_env_setup: Path, mock_genai_client: Mock) -> No
         assert "test.py" in result.stdout
 
 
+def test_list_files_command_json(mock_env_setup: Path, mock_genai_client: Mock) -> None:
+    """Test list-files command with JSON output."""
+    env_file = mock_env_setup
+    env_file.write_text(
+        "GOOGLE_API_KEY=test_key_123\n"
+        "FILE_SEARCH_STORE_ID=test_id\n"
+        "FILE_SEARCH_STORE_NAME=fileSearchStores/test_id\n"
+    )
+
+    mock_file = MagicMock()
+    mock_file.name = "test.py"
+    mock_file.display_name = "test.py"
+    mock_file.size_bytes = 2048
+    mock_file.state = "ACTIVE"
+    mock_genai_client.file_search_stores.list_files.return_value = [mock_file]
+
+    with patch("codebase_search_cli.gemini_client.genai.Client", return_value=mock_genai_client):
+        result = runner.invoke(app, ["list-files", "--json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == [
+            {"name": "test.py", "display_name": "test.py", "size_bytes": 2048, "state": "ACTIVE"}
+        ]
+
+
 def test_info_command(mock_env_setup: Path) -> None:
     """Test info command."""
     env_file = mock_env_setup
@@ -19,11 +19,15 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from parser import parse_agents_file
 from rule_extractor import RuleExtractor
 from scenario_generator import ScenarioGenerator
-from session_manager import SessionManager
 from test_runner import TestExecutor
 from validator import ResponseValidator, ConsistencyAnalyzer
 from reporter import Reporter
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
 
 def load_config(config_path: str) -> dict:
     """Load configuration from YAML file."""
@@ -35,7 +39,7 @@ def load_config(config_path: str) -> dict:
         return {}
 
     with open(config_file, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f.read(), Loader=YamlLoader)
 
 
 def main():
@@ -210,9 +214,16 @@ Examples:
 
     session_manager = None
     if not args.no_isolation:
+        # Imported here so --no-isolation and --dry-run runs never load libtmux
+        from session_manager import SessionManager
+
         session_manager = SessionManager(config)
 
-    executor = TestExecutor(config, session_manager)
+    try:
+        executor = TestExecutor(config, session_manager)
+    except ValueError as e:
+        print(f"{Fore.RED}Invalid configuration: {e}{Style.RESET_ALL}")
+        sys.exit(1)
 
     try:
         execution_results = executor.execute_all(
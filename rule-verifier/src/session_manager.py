@@ -4,7 +4,7 @@ Session Manager - Manage isolated tmux sessions for testing.
 
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 import libtmux
 import time
 
@@ -40,14 +40,15 @@ class SessionManager:
         """
         session_name = f"{self.prefix}{session_id}"
 
-        # Check if session already exists
-        if self.server.has_session(session_name):
-            raise ValueError(f"Session {session_name} already exists")
-
         # Create temporary directory for this session
         session_dir = self.base_dir / session_id
         session_dir.mkdir(parents=True, exist_ok=True)
 
+        # Runner files (script, output, exit code) live beside the working
+        # directory rather than in it, so the model under test never sees them
+        artifacts_dir = self.base_dir / f"{session_id}.run"
+        artifacts_dir.mkdir(parents=True, exist_ok=True)
+
         # Copy AGENTS.md/CLAUDE.md file if provided
         if agents_file:
             agents_path = Path(agents_file)
@@ -55,19 +56,24 @@ class SessionManager:
                 dest_path = session_dir / agents_path.name
                 shutil.copy2(agents_path, dest_path)
 
-        # Create tmux session
-        session = self.server.new_session(
-            session_name=session_name,
-            start_directory=str(session_dir),
-            attach=False,
-            kill_session=True,  # Kill existing session if it exists
-        )
+        # Create tmux session; libtmux already checks for an existing session
+        # with the same name, so a separate has_session() call would fork tmux twice
+        try:
+            session = self.server.new_session(
+                session_name=session_name,
+                start_directory=str(session_dir),
+                attach=False,
+            )
+        except libtmux.exc.TmuxSessionExists:
+            raise ValueError(f"Session {session_name} already exists")
 
         # Store session info
         session_info = {
             "session_id": session_id,
             "session_name": session_name,
             "session_dir": str(session_dir),
+            "session_path": session_dir,
+            "artifacts_path": artifacts_dir,
             "tmux_session": session,
             "agents_file": agents_file,
             "created_at": time.time(),
@@ -97,28 +103,21 @@ class SessionManager:
         session_info = self.active_sessions[session_id]
         tmux_session = session_info["tmux_session"]
 
-        # Get the first window and pane
-        window = tmux_session.attached_window
-        if not window:
-            window = tmux_session.windows[0]
-
-        pane = window.attached_pane
-        if not pane:
-            pane = window.panes[0]
+        pane = tmux_session.active_window.active_pane
 
         # Send the command
         pane.send_keys(command)
 
+        # Fire-and-forget callers track completion themselves
+        if not capture_output:
+            return None
+
         # Wait a bit for command to execute
         time.sleep(0.5)
 
-        # Capture output if requested
-        if capture_output:
-            # Get pane content
-            output = pane.capture_pane()
-            return "\n".join(output)
-
-        return None
+        # Get pane content
+        output = pane.capture_pane()
+        return "\n".join(output)
 
     def get_session_info(self, session_id: str) -> Optional[Dict]:
         """Get information about a session."""
@@ -138,52 +137,85 @@ class SessionManager:
         Returns:
             True if cleanup was successful
         """
-        if session_id not in self.active_sessions:
-            return False
-
-        session_info = self.active_sessions[session_id]
-
-        try:
-            # Kill tmux session
-            tmux_session = session_info["tmux_session"]
-            tmux_session.kill_session()
+        return self.cleanup_sessions([session_id]) == 1
 
-            # Remove session directory if cleanup is enabled
-            if self.cleanup_enabled:
-                session_dir = Path(session_info["session_dir"])
-                if session_dir.exists():
-                    shutil.rmtree(session_dir)
+    def cleanup_all(self) -> int:
+        """
+        Clean up all active sessions.
 
-            # Remove from active sessions
-            del self.active_sessions[session_id]
+        Returns:
+            Number of sessions cleaned up
+        """
+        return self.cleanup_sessions(list(self.active_sessions.keys()))
 
-            return True
+    def cleanup_sessions(self, session_ids: List[str]) -> int:
+        """
+        Clean up several sessions at once.
 
-        except Exception as e:
-            print(f"Error cleaning up session {session_id}: {e}")
-            return False
+        All tmux sessions are killed with a single chained tmux command
+        instead of one tmux invocation per session. If the chained command
+        fails (tmux stops at the first error), each session is retried
+        individually. Sessions tmux still fails to kill are reported, kept
+        in active_sessions and left out of the count.
 
-    def cleanup_all(self) -> int:
-        """
-        Clean up all active sessions.
+        Args:
+            session_ids: Session identifiers to clean up
 
         Returns:
             Number of sessions cleaned up
         """
-        session_ids = list(self.active_sessions.keys())
-        cleaned = 0
+        session_infos = [
+            self.active_sessions[session_id]
+            for session_id in session_ids
+            if session_id in self.active_sessions
+        ]
+        if not session_infos:
+            return 0
+
+        kill_args: List[str] = []
+        for session_info in session_infos:
+            kill_args.extend([";", "kill-session", "-t", session_info["session_name"]])
+
+        failed: Set[str] = set()
+        result = self.server.cmd(*kill_args[1:])
+        if result.stderr:
+            for session_info in session_infos:
+                result = self.server.cmd("kill-session", "-t", session_info["session_name"])
+                # A session that is already gone needs no killing
+                already_gone = any("can't find session" in line for line in result.stderr)
+                if result.stderr and not already_gone:
+                    print(
+                        f"Error cleaning up session {session_info['session_id']}: "
+                        f"{' '.join(result.stderr)}"
+                    )
+                    failed.add(session_info["session_id"])
 
-        for session_id in session_ids:
-            if self.cleanup_session(session_id):
+        cleaned = 0
+        for session_info in session_infos:
+            # Keep sessions tmux failed to kill so they can be retried
+            if session_info["session_id"] in failed:
+                continue
+
+            try:
+                # Remove session and artifact directories if cleanup is enabled
+                if self.cleanup_enabled:
+                    for path in (session_info["session_path"], session_info["artifacts_path"]):
+                        if path.exists():
+                            shutil.rmtree(path)
+
+                del self.active_sessions[session_info["session_id"]]
                 cleaned += 1
 
+            except Exception as e:
+                print(f"Error cleaning up session {session_info['session_id']}: {e}")
+
         return cleaned
 
     def get_session_directory(self, session_id: str) -> Optional[Path]:
         """Get the working directory for a session."""
         session_info = self.active_sessions.get(session_id)
         if session_info:
-            return Path(session_info["session_dir"])
+            return session_info["session_path"]
         return None
 
     def __enter__(self):
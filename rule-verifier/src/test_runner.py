@@ -2,8 +2,10 @@
 Test Runner - Execute test scenarios using Claude CLI.
 """
 
+import shlex
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
 from pathlib import Path
 
@@ -155,34 +157,54 @@ class TestRunner:
         try:
             # Create isolated session
             session_info = self.session_manager.create_session(session_id, agents_file)
-            session_dir = session_info["session_dir"]
-
-            # Create a temporary script to run Claude
-            script_path = Path(session_dir) / "run_test.sh"
+            artifacts_dir = session_info["artifacts_path"]
+
+            # Create a temporary script to run Claude. It and its output stay
+            # out of the session directory, which is Claude's working directory.
+            script_path = artifacts_dir / "run_test.sh"
+            output_path = artifacts_dir / "output.txt"
+            stderr_path = artifacts_dir / "stderr.txt"
+            exit_code_path = artifacts_dir / "exit_code"
             prompt = scenario.get("prompt", "")
 
-            # Escape quotes in prompt
-            prompt_escaped = prompt.replace('"', '\\"')
+            # Quote everything for bash; prompts routinely contain $, ` and quotes.
+            # No cd is needed: the tmux session already starts in the session directory.
+            output_arg = shlex.quote(str(output_path))
+            stderr_arg = shlex.quote(str(stderr_path))
+            exit_code_arg = shlex.quote(str(exit_code_path))
+            exit_code_tmp_arg = shlex.quote(f"{exit_code_path}.tmp")
 
+            # stdout is the response and stderr only explains failures, as in
+            # _execute_claude. The exit code is written via rename so it only
+            # appears once complete.
             script_content = f"""#!/bin/bash
-cd {session_dir}
-{self.claude_cli} -p "{prompt_escaped}"
+{shlex.quote(self.claude_cli)} -p {shlex.quote(prompt)} > {output_arg} 2> {stderr_arg}
+echo $? > {exit_code_tmp_arg} && mv {exit_code_tmp_arg} {exit_code_arg}
 """
 
             script_path.write_text(script_content)
             script_path.chmod(0o755)
 
+            # Artifact directories may be reused when cleanup is disabled
+            exit_code_path.unlink(missing_ok=True)
+
             # Run the script in the tmux session
             start_time = time.time()
 
             self.session_manager.execute_command(
-                session_id, f"bash {script_path}", capture_output=False
+                session_id, f"bash {shlex.quote(str(script_path))}", capture_output=False
             )
 
-            # Wait for completion and capture output
-            time.sleep(2)  # Give it time to execute
+            # Wait for completion instead of sleeping a fixed amount
+            exit_code = self._wait_for_exit_code(exit_code_path, start_time + self.timeout)
+            if exit_code is None:
+                raise subprocess.TimeoutExpired(script_path.name, self.timeout)
 
-            output = self.session_manager.execute_command(session_id, "", capture_output=True)
+            if exit_code != 0:
+                stderr = stderr_path.read_text() if stderr_path.exists() else ""
+                raise RuntimeError(f"Claude CLI failed: {stderr.strip()}")
+
+            output = output_path.read_text() if output_path.exists() else ""
 
             end_time = time.time()
             duration = end_time - start_time
@@ -194,7 +216,7 @@ cd {session_dir}
                 "scenario_id": scenario_id,
                 "iteration": iteration,
                 "success": True,
-                "response": output or "",
+                "response": output.strip(),
                 "error": None,
                 "duration": duration,
                 "timestamp": start_time,
@@ -211,12 +233,33 @@ cd {session_dir}
                 "iteration": iteration,
                 "success": False,
                 "response": "",
-                "error": str(e),
+                "error": "Timeout" if isinstance(e, subprocess.TimeoutExpired) else str(e),
                 "duration": 0,
                 "timestamp": time.time(),
                 "isolated": True,
             }
 
+    @staticmethod
+    def _wait_for_exit_code(
+        exit_code_path: Path, deadline: float, poll_interval: float = 0.05
+    ) -> Optional[int]:
+        """
+        Wait for a run script to record its exit code.
+
+        Args:
+            exit_code_path: File the script writes its exit code to on completion
+            deadline: time.time() value after which to give up
+            poll_interval: Seconds between existence checks
+
+        Returns:
+            The exit code, or None if the deadline passed first
+        """
+        while time.time() < deadline:
+            if exit_code_path.exists():
+                return int(exit_code_path.read_text().strip() or 1)
+            time.sleep(poll_interval)
+        return None
+
 
 class TestExecutor:
     """High-level test execution orchestrator."""
@@ -226,6 +269,13 @@ class TestExecutor:
         self.session_manager = session_manager
         self.runner = TestRunner(config, session_manager)
         self.iterations = config.get("test", {}).get("iterations", 5)
+        self.parallel = config.get("test", {}).get("parallel", False)
+        self.max_workers = config.get("test", {}).get("max_workers", 4)
+
+        if self.parallel and (not isinstance(self.max_workers, int) or self.max_workers < 1):
+            raise ValueError(
+                f"test.max_workers must be a positive integer, got {self.max_workers!r}"
+            )
 
     def execute_all(self, scenarios: List[Dict], agents_file: Optional[str] = None) -> Dict:
         """
@@ -241,9 +291,36 @@ class TestExecutor:
         print(f"\nExecuting {len(scenarios)} scenarios with {self.iterations} iterations each...")
         print(f"Total tests to run: {len(scenarios) * self.iterations}\n")
 
-        all_results = []
         start_time = time.time()
 
+        if self.parallel:
+            all_results = self._execute_parallel(scenarios, agents_file)
+        else:
+            all_results = self._execute_sequential(scenarios, agents_file)
+
+        end_time = time.time()
+        total_duration = end_time - start_time
+
+        return {
+            "results": all_results,
+            "total_tests": len(all_results),
+            "total_scenarios": len(scenarios),
+            "iterations": self.iterations,
+            "total_duration": total_duration,
+            "started_at": start_time,
+            "completed_at": end_time,
+        }
+
+    def _run_one(self, scenario: Dict, iteration: int, agents_file: Optional[str]) -> Dict:
+        """Run a single iteration of a scenario, isolated if possible."""
+        if agents_file and self.session_manager:
+            return self.runner.run_with_isolation(scenario, agents_file, iteration)
+        return self.runner.run_scenario(scenario, iteration)
+
+    def _execute_sequential(self, scenarios: List[Dict], agents_file: Optional[str]) -> List[Dict]:
+        """Run every scenario iteration one after another."""
+        all_results = []
+
         for i, scenario in enumerate(scenarios, 1):
             scenario_id = scenario.get("scenario_id", "unknown")
             rule_id = scenario.get("rule_id", "unknown")
@@ -256,13 +333,7 @@ class TestExecutor:
             for iteration in range(self.iterations):
                 print(f"  Iteration {iteration + 1}/{self.iterations}...", end=" ")
 
-                if agents_file and self.session_manager:
-                    # Run with isolation
-                    result = self.runner.run_with_isolation(scenario, agents_file, iteration)
-                else:
-                    # Run without isolation
-                    result = self.runner.run_scenario(scenario, iteration)
-
+                result = self._run_one(scenario, iteration, agents_file)
                 scenario_results.append(result)
 
                 if result["success"]:
@@ -276,15 +347,53 @@ class TestExecutor:
             all_results.extend(scenario_results)
             print()
 
-        end_time = time.time()
-        total_duration = end_time - start_time
+        return all_results
 
-        return {
-            "results": all_results,
-            "total_tests": len(all_results),
-            "total_scenarios": len(scenarios),
-            "iterations": self.iterations,
-            "total_duration": total_duration,
-            "started_at": start_time,
-            "completed_at": end_time,
-        }
+    def _execute_parallel(self, scenarios: List[Dict], agents_file: Optional[str]) -> List[Dict]:
+        """
+        Run scenario iterations concurrently on a thread pool.
+
+        Each test is dominated by waiting on the Claude CLI subprocess, so
+        overlapping them brings wall time close to the slowest single test.
+        Progress is printed as each test finishes; results are returned in
+        the same order as sequential execution.
+        """
+        jobs = [
+            (scenario, iteration)
+            for scenario in scenarios
+            for iteration in range(self.iterations)
+        ]
+
+        print(f"Running in parallel with up to {self.max_workers} workers\n")
+
+        results_by_index: Dict[int, Dict] = {}
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {
+                pool.submit(self._run_one, scenario, iteration, agents_file): index
+                for index, (scenario, iteration) in enumerate(jobs)
+            }
+
+            # Report each test as it finishes; results keep submission order
+            for completed, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results_by_index[futures[future]] = result
+
+                if result["success"]:
+                    status = "✓"
+                else:
+                    status = f"✗ ({result.get('error', 'Unknown error')})"
+                print(
+                    f"  [{completed}/{len(jobs)}] {result['scenario_id']} "
+                    f"(iteration {result['iteration'] + 1}/{self.iterations}) {status}"
+                )
+        except BaseException:
+            # Ctrl-C or a failing test: don't start the queued tests
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
+
+        print()
+
+        return [results_by_index[index] for index in range(len(jobs))]
@@ -4,7 +4,11 @@ Integration tests for rule verifier.
 These tests verify the complete workflow with a test fixture codebase.
 """
 
+import shutil
+import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 import pytest
 
@@ -15,7 +19,7 @@ from parser import parse_agents_file
 from rule_extractor import RuleExtractor
 from scenario_generator import ScenarioGenerator
 from validator import ResponseValidator
-from test_runner import TestRunner as BaseTestRunner
+from test_runner import TestRunner as BaseTestRunner, TestExecutor as BaseTestExecutor
 
 
 # Fixtures
@@ -125,6 +129,45 @@ class MockTestRunner(BaseTestRunner):
                 }
 
 
+class LocalSessionManager:
+    """Session manager stand-in that runs commands in a local shell instead of tmux."""
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = base_dir
+        self.sessions = {}
+        self.processes = {}
+
+    def create_session(self, session_id, agents_file=None):
+        session_dir = self.base_dir / session_id
+        session_dir.mkdir()
+        artifacts_dir = self.base_dir / f"{session_id}.run"
+        artifacts_dir.mkdir()
+        if agents_file:
+            shutil.copy2(agents_file, session_dir)
+
+        self.sessions[session_id] = {
+            "session_id": session_id,
+            "session_path": session_dir,
+            "artifacts_path": artifacts_dir,
+        }
+        return self.sessions[session_id]
+
+    def execute_command(self, session_id, command, capture_output=True):
+        cwd = self.sessions[session_id]["session_path"]
+        self.processes[session_id] = subprocess.Popen(command, shell=True, cwd=cwd)
+
+    def get_session_info(self, session_id):
+        return self.sessions.get(session_id)
+
+    def cleanup_session(self, session_id):
+        process = self.processes.pop(session_id, None)
+        if process:
+            process.kill()
+            process.wait()
+        self.sessions.pop(session_id, None)
+        return True
+
+
 @pytest.fixture
 def config():
     """Provide test configuration."""
@@ -463,6 +506,136 @@ def test_full_integration_workflow(config):
     assert len(results_incorrect) > 0
 
 
+def test_parallel_execution_preserves_order(config, scenarios):
+    """Parallel execution returns results in the same order as sequential runs."""
+    parallel_config = dict(config, test={"iterations": 2, "parallel": True, "max_workers": 4})
+
+    executor = BaseTestExecutor(parallel_config)
+    executor.runner = MockTestRunner(parallel_config, response_mode="correct")
+
+    execution = executor.execute_all(scenarios)
+
+    expected = [(s["scenario_id"], i) for s in scenarios for i in range(2)]
+    actual = [(r["scenario_id"], r["iteration"]) for r in execution["results"]]
+
+    assert actual == expected
+    assert execution["total_tests"] == len(scenarios) * 2
+    assert all(r["success"] for r in execution["results"])
+
+
+def test_sequential_execution_returns_all_results(config, scenarios):
+    """Sequential execution runs every iteration in order."""
+    sequential_config = dict(config, test={"iterations": 1, "parallel": False})
+
+    executor = BaseTestExecutor(sequential_config)
+    executor.runner = MockTestRunner(sequential_config, response_mode="correct")
+
+    execution = executor.execute_all(scenarios[:1])
+
+    assert [r["scenario_id"] for r in execution["results"]] == [scenarios[0]["scenario_id"]]
+    assert execution["total_tests"] == 1
+
+
+def test_parallel_execution_stops_on_interrupt(config):
+    """An interrupt during a parallel run does not start the queued tests."""
+    parallel_config = dict(config, test={"iterations": 20, "parallel": True, "max_workers": 2})
+    started = []
+    lock = threading.Lock()
+
+    class InterruptedRunner(MockTestRunner):
+        def run_scenario(self, scenario, iteration=0):
+            with lock:
+                started.append(iteration)
+            if iteration == 0:
+                raise KeyboardInterrupt
+            time.sleep(0.2)
+            return super().run_scenario(scenario, iteration)
+
+    executor = BaseTestExecutor(parallel_config)
+    executor.runner = InterruptedRunner(parallel_config)
+
+    start = time.time()
+    with pytest.raises(KeyboardInterrupt):
+        executor.execute_all([{"scenario_id": "s1", "prompt": "hi"}])
+
+    assert time.time() - start < 1
+    # Give any still-running worker time to pick up more work if it were allowed to.
+    # A worker may grab one more job before the interrupt reaches the main thread.
+    time.sleep(0.5)
+    assert len(started) <= parallel_config["test"]["max_workers"] + 1
+
+
+def test_parallel_execution_rejects_invalid_max_workers(config):
+    """A non-positive max_workers is reported as a configuration error."""
+    parallel_config = dict(config, test={"iterations": 1, "parallel": True, "max_workers": 0})
+
+    with pytest.raises(ValueError, match="max_workers"):
+        BaseTestExecutor(parallel_config)
+
+
+class TestIsolatedRun:
+    """run_with_isolation against a fake Claude CLI."""
+
+    @staticmethod
+    def make_runner(tmp_path, cli_body, timeout=10):
+        """Build a runner whose Claude CLI is a bash script with the given body."""
+        cli_path = tmp_path / "fake_claude"
+        cli_path.write_text(f"#!/bin/bash\n{cli_body}\n")
+        cli_path.chmod(0o755)
+
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        runner_config = {"claude": {"cli_path": str(cli_path)}, "test": {"timeout": timeout}}
+        return BaseTestRunner(runner_config, LocalSessionManager(sessions_dir))
+
+    def test_run_sees_only_agents_file(self, tmp_path):
+        """Claude sees only the agents file in its working directory and gets the exact prompt."""
+        runner = self.make_runner(tmp_path, 'ls -A\necho "prompt: $2"')
+        scenario = {"scenario_id": "s1", "prompt": "Use \"quotes\", $HOME and `backticks`"}
+
+        result = runner.run_with_isolation(scenario, str(AGENTS_FILE))
+
+        assert result["success"], result["error"]
+        assert result["response"] == f"AGENTS.md\nprompt: {scenario['prompt']}"
+
+    def test_stderr_is_not_part_of_response(self, tmp_path):
+        """Warnings on stderr are kept out of the scored response."""
+        runner = self.make_runner(tmp_path, "echo 'warning: update available' >&2\necho answer")
+
+        result = runner.run_with_isolation({"scenario_id": "s1", "prompt": "hi"}, str(AGENTS_FILE))
+
+        assert result["success"], result["error"]
+        assert result["response"] == "answer"
+
+    def test_nonzero_exit_is_reported(self, tmp_path):
+        """A failing Claude CLI is reported with its stderr."""
+        runner = self.make_runner(tmp_path, "echo partial\necho boom >&2\nexit 3")
+
+        result = runner.run_with_isolation({"scenario_id": "s1", "prompt": "hi"}, str(AGENTS_FILE))
+
+        assert not result["success"]
+        assert result["error"] == "Claude CLI failed: boom"
+
+    def test_timeout_is_reported(self, tmp_path):
+        """A Claude CLI that outlives the test timeout is reported as a timeout."""
+        runner = self.make_runner(tmp_path, "sleep 5", timeout=0.3)
+
+        result = runner.run_with_isolation({"scenario_id": "s1", "prompt": "hi"}, str(AGENTS_FILE))
+
+        assert not result["success"]
+        assert result["error"] == "Timeout"
+        assert not runner.session_manager.sessions
+
+    def test_wait_for_exit_code(self, tmp_path):
+        """The exit code is read once written, and None is returned at the deadline."""
+        exit_code_path = tmp_path / "exit_code"
+
+        assert BaseTestRunner._wait_for_exit_code(exit_code_path, time.time() + 0.1) is None
+
+        exit_code_path.write_text("7\n")
+        assert BaseTestRunner._wait_for_exit_code(exit_code_path, time.time() + 0.1) == 7
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,199 @@
+"""
+Unit tests for session management.
+
+The tmux server and panes are mocked, so these tests run without tmux.
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock, call
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from session_manager import SessionManager, SessionPool
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Provide a session manager with a mocked tmux server."""
+    config = {"session": {"base_dir": str(tmp_path), "tmux_prefix": "rv-"}}
+    manager = SessionManager(config)
+    manager.server = Mock()
+    manager.server.cmd.return_value = Mock(stderr=[])
+    return manager
+
+
+def add_session(manager, session_id):
+    """Register a fake session as if create_session had been called."""
+    session_dir = manager.base_dir / session_id
+    session_dir.mkdir()
+    artifacts_dir = manager.base_dir / f"{session_id}.run"
+    artifacts_dir.mkdir()
+    manager.active_sessions[session_id] = {
+        "session_id": session_id,
+        "session_name": f"{manager.prefix}{session_id}",
+        "session_dir": str(session_dir),
+        "session_path": session_dir,
+        "artifacts_path": artifacts_dir,
+        "tmux_session": Mock(),
+    }
+    return session_dir
+
+
+class TestCreateSession:
+    """Session directory layout."""
+
+    def test_runner_artifacts_stay_outside_working_directory(self, manager, tmp_path):
+        """Only the agents file is placed in the session's working directory."""
+        agents_file = tmp_path / "AGENTS.md"
+        agents_file.write_text("# Rules\n")
+
+        info = manager.create_session("a", str(agents_file))
+
+        assert [p.name for p in info["session_path"].iterdir()] == ["AGENTS.md"]
+        assert info["artifacts_path"].is_dir()
+        assert info["artifacts_path"].parent == info["session_path"].parent
+
+
+class TestExecuteCommand:
+    """Sending commands to a session's pane."""
+
+    def test_fire_and_forget_returns_immediately(self, manager):
+        """Without capture the keys are sent and nothing is read back."""
+        add_session(manager, "a")
+        pane = manager.active_sessions["a"]["tmux_session"].active_window.active_pane
+
+        start = time.time()
+        assert manager.execute_command("a", "bash run.sh", capture_output=False) is None
+
+        assert time.time() - start < 0.5
+        pane.send_keys.assert_called_once_with("bash run.sh")
+        pane.capture_pane.assert_not_called()
+
+    def test_capture_returns_pane_content(self, manager):
+        """With capture the pane content is returned after the command is sent."""
+        add_session(manager, "a")
+        pane = manager.active_sessions["a"]["tmux_session"].active_window.active_pane
+        pane.capture_pane.return_value = ["$ echo hi", "hi"]
+
+        assert manager.execute_command("a", "echo hi") == "$ echo hi\nhi"
+        pane.send_keys.assert_called_once_with("echo hi")
+
+
+class TestCleanupSessions:
+    """Batched tmux teardown."""
+
+    def test_kills_all_sessions_in_one_command(self, manager):
+        """All sessions are killed with one chained tmux command."""
+        dirs = [add_session(manager, "a"), add_session(manager, "b")]
+
+        assert manager.cleanup_all() == 2
+
+        manager.server.cmd.assert_called_once_with(
+            "kill-session", "-t", "rv-a", ";", "kill-session", "-t", "rv-b"
+        )
+        assert manager.active_sessions == {}
+        assert not any(d.exists() for d in dirs)
+        assert not (manager.base_dir / "a.run").exists()
+
+    def test_falls_back_to_per_session_kill_on_error(self, manager):
+        """A failed chained kill is retried one session at a time."""
+        add_session(manager, "a")
+        add_session(manager, "b")
+        manager.server.cmd.side_effect = [
+            Mock(stderr=["can't find session: rv-a"]),
+            Mock(stderr=["can't find session: rv-a"]),
+            Mock(stderr=[]),
+        ]
+
+        assert manager.cleanup_all() == 2
+
+        assert manager.server.cmd.call_args_list == [
+            call("kill-session", "-t", "rv-a", ";", "kill-session", "-t", "rv-b"),
+            call("kill-session", "-t", "rv-a"),
+            call("kill-session", "-t", "rv-b"),
+        ]
+        assert manager.active_sessions == {}
+
+    def test_reports_sessions_tmux_fails_to_kill(self, manager, capsys):
+        """A fallback kill that fails for any reason but a missing session is not counted."""
+        add_session(manager, "a")
+        kept_dir = add_session(manager, "b")
+        manager.server.cmd.side_effect = [
+            Mock(stderr=["can't find session: rv-a"]),
+            Mock(stderr=["can't find session: rv-a"]),
+            Mock(stderr=["no server running on /tmp/tmux-0/default"]),
+        ]
+
+        assert manager.cleanup_all() == 1
+
+        assert list(manager.active_sessions) == ["b"]
+        assert kept_dir.exists()
+        assert "Error cleaning up session b: no server running" in capsys.readouterr().out
+
+    def test_cleanup_session_only_touches_that_session(self, manager):
+        """Cleaning up one session leaves the others running."""
+        add_session(manager, "a")
+        kept_dir = add_session(manager, "b")
+
+        assert manager.cleanup_session("a") is True
+
+        manager.server.cmd.assert_called_once_with("kill-session", "-t", "rv-a")
+        assert list(manager.active_sessions) == ["b"]
+        assert kept_dir.exists()
+
+    def test_unknown_sessions_are_ignored(self, manager):
+        """Unknown session ids do not reach tmux."""
+        assert manager.cleanup_sessions(["missing"]) == 0
+        manager.server.cmd.assert_not_called()
+
+    def test_keeps_directories_when_cleanup_disabled(self, manager):
+        """Session directories survive when cleanup_after_test is off."""
+        manager.cleanup_enabled = False
+        session_dir = add_session(manager, "a")
+
+        assert manager.cleanup_all() == 1
+        assert session_dir.exists()
+
+
+@pytest.fixture
+def pool(tmp_path):
+    """Provide an initialized two-session pool without tmux."""
+    pool = SessionPool({"session": {"base_dir": str(tmp_path)}}, pool_size=2)
+    pool.manager = Mock()
+    pool.initialize()
+    return pool
+
+
+class TestSessionPool:
+    """Session checkout and release."""
+
+    def test_acquire_hands_out_each_session_once(self, pool):
+        """Every pooled session is handed out once before the pool runs dry."""
+        acquired = {pool.acquire_session(), pool.acquire_session()}
+
+        assert acquired == set(pool.available_sessions)
+        assert pool.acquire_session() is None
+
+    def test_double_release_does_not_duplicate_session(self, pool):
+        """Releasing the same session twice only returns it to the pool once."""
+        session_id = pool.acquire_session()
+        pool.release_session(session_id)
+        pool.release_session(session_id)
+
+        acquired = [pool.acquire_session() for _ in range(3)]
+
+        assert sorted(acquired[:2]) == sorted(pool.available_sessions)
+        assert acquired[2] is None
+
+    def test_release_of_unknown_session_is_ignored(self, pool):
+        """Ids that were never checked out are not added to the pool."""
+        pool.release_session("not-pooled")
+
+        acquired = [pool.acquire_session() for _ in range(3)]
+
+        assert "not-pooled" not in acquired
+        assert acquired[2] is None
@@ -3,6 +3,8 @@
 import csv
 import logging
 import sys
+import time
+from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
 from uuid import UUID
@@ -758,15 +760,11 @@ def optimize_dataset(
     }
 
     # Determine version for this run and capture before state
-    import time
-
-    # Create a copy of the initial model for comparison
-    from copy import deepcopy
-
     next_version = optimizer_instance._get_next_version("unused")
     if output is None:
         output = MODELS_DIR / f"matcher_v{next_version}.json"
 
+    # Create a copy of the initial model for comparison
     before_model = deepcopy(optimizer_instance.matcher)
     start_time = time.time()
 
@@ -798,7 +796,7 @@ def optimize_dataset(
             )
             validation_score = evaluator(optimized_model)
         except Exception as e:
-            logger.warning(f"Could not compute validation score: {e}")
+            logger.warning("Could not compute validation score: %s", e)
 
         # Save optimized model
         optimizer_instance.save_optimized_model(optimized_model, str(output))
@@ -820,7 +818,7 @@ def optimize_dataset(
                 )
                 click.echo(f"✓ Optimization config saved to {config_file.name}")
             except Exception as e:
-                logger.warning(f"Could not save optimization config: {e}")
+                logger.warning("Could not save optimization config: %s", e)
                 click.echo(f"⚠ Warning: Could not save optimization config: {e}", err=True)
 
         # Generate report if requested
@@ -1,6 +1,8 @@
 """WordPress VIP API connector for content ingestion."""
 
+import html
 import logging
+import re
 from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, cast
@@ -56,7 +58,7 @@ class WordPressVIPConnector:
             }
         )
 
-        logger.info(f"Initialized WordPress connector for {self.site_url}")
+        logger.info("Initialized WordPress connector for %s", self.site_url)
 
     @retry(
         retry=retry_if_exception_type(requests.exceptions.RequestException),
@@ -165,16 +167,12 @@ class WordPressVIPConnector:
             Plain text content.
         """
         # Simple HTML tag removal - in production, use BeautifulSoup or similar
-        import re
-
         # Remove script and style elements
         text = re.sub(r"<script[^>]*>.*?</script>", "", html_content, flags=re.DOTALL)
         text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL)
         # Remove HTML tags
         text = re.sub(r"<[^>]+>", "", text)
         # Decode HTML entities
-        import html
-
         text = html.unescape(text)
         # Clean up whitespace
         text = re.sub(r"\s+", " ", text).strip()
@@ -267,7 +265,7 @@ class WordPressVIPConnector:
                     if progress_bar is not None:
                         progress_bar.update(1)
                 except Exception as e:
-                    logger.error(f"Error parsing post {post_data.get('id')}: {e}")
+                    logger.error("Error parsing post %s: %s", post_data.get("id"), e)
                     continue
 
             page += 1
@@ -275,7 +273,7 @@ class WordPressVIPConnector:
         if progress_bar is not None:
             progress_bar.close()
 
-        logger.info(f"Fetched {total_fetched} posts from {self.site_url}")
+        logger.info("Fetched %s posts from %s", total_fetched, self.site_url)
 
     def fetch_all_pages(
         self,
@@ -315,7 +313,7 @@ class WordPressVIPConnector:
                     if progress_bar is not None:
                         progress_bar.update(1)
                 except Exception as e:
-                    logger.error(f"Error parsing page {page_data.get('id')}: {e}")
+                    logger.error("Error parsing page %s: %s", page_data.get("id"), e)
                     continue
 
             page += 1
@@ -323,7 +321,7 @@ class WordPressVIPConnector:
         if progress_bar is not None:
             progress_bar.close()
 
-        logger.info(f"Fetched {total_fetched} pages from {self.site_url}")
+        logger.info("Fetched %s pages from %s", total_fetched, self.site_url)
 
     def fetch_all_content(
         self,
@@ -365,8 +363,8 @@ class WordPressVIPConnector:
             url = urljoin(self.site_url, "/wp-json/")
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
-            logger.info(f"Successfully connected to {self.site_url}")
+            logger.info("Successfully connected to %s", self.site_url)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to {self.site_url}: {e}")
+            logger.error("Failed to connect to %s: %s", self.site_url, e)
             return False
@@ -49,7 +49,7 @@ class SupabaseClient:
         """
         data = content.model_dump(mode="json")
         result = self.client.table("wordpress_content").insert(data).execute()
-        logger.debug(f"Inserted content: {content.url}")
+        logger.debug("Inserted content: %s", content.url)
         return WordPressContent.model_validate(result.data[0])
 
     def upsert_content(self, content: WordPressContent) -> WordPressContent:
@@ -63,7 +63,7 @@ class SupabaseClient:
         """
         data = content.model_dump(mode="json")
         result = self.client.table("wordpress_content").upsert(data, on_conflict="url").execute()
-        logger.debug(f"Upserted content: {content.url}")
+        logger.debug("Upserted content: %s", content.url)
         return WordPressContent.model_validate(result.data[0])
 
     def get_content_by_url(self, url: str) -> WordPressContent | None:
@@ -161,7 +161,7 @@ class SupabaseClient:
         """
         data = taxonomy.model_dump(mode="json")
         result = self.client.table("taxonomy_pages").insert(data).execute()
-        logger.debug(f"Inserted taxonomy: {taxonomy.url}")
+        logger.debug("Inserted taxonomy: %s", taxonomy.url)
         return TaxonomyPage.model_validate(result.data[0])
 
     def upsert_taxonomy(self, taxonomy: TaxonomyPage) -> TaxonomyPage:
@@ -175,7 +175,7 @@ class SupabaseClient:
         """
         data = taxonomy.model_dump(mode="json")
         result = self.client.table("taxonomy_pages").upsert(data, on_conflict="url").execute()
-        logger.debug(f"Upserted taxonomy: {taxonomy.url}")
+        logger.debug("Upserted taxonomy: %s", taxonomy.url)
         return TaxonomyPage.model_validate(result.data[0])
 
     def get_all_taxonomy(self) -> list[TaxonomyPage]:
@@ -238,7 +238,7 @@ class SupabaseClient:
         """
         data = result.model_dump(mode="json")
         db_result = self.client.table("categorization_results").insert(data).execute()
-        logger.debug(f"Inserted categorization for content: {result.content_id}")
+        logger.debug("Inserted categorization for content: %s", result.content_id)
         return CategorizationResult.model_validate(db_result.data[0])
 
     def get_categorizations_by_content(self, content_id: UUID) -> list[CategorizationResult]:
@@ -288,7 +288,7 @@ class SupabaseClient:
         data = result.model_dump(mode="json")
         db_result = self.client.table("matching_results").insert(data).execute()
         logger.debug(
-            f"Inserted matching: taxonomy={result.taxonomy_id}, content={result.content_id}"
+            "Inserted matching: taxonomy=%s, content=%s", result.taxonomy_id, result.content_id
         )
         return MatchingResult.model_validate(db_result.data[0])
 
@@ -401,4 +401,4 @@ class SupabaseClient:
         if not records:
             return
         self.client.table(table).insert(records).execute()
-        logger.info(f"Bulk inserted {len(records)} records into {table}")
+        logger.info("Bulk inserted %s records into %s", len(records), table)
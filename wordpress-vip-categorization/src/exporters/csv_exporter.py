@@ -78,7 +78,7 @@ class CSVExporter:
             )
             rows.append(row)
 
-        logger.info(f"Prepared {len(rows)} export rows")
+        logger.info("Prepared %s export rows", len(rows))
         return rows
 
     def export_to_csv(
@@ -143,7 +143,7 @@ class CSVExporter:
                     }
                 )
 
-        logger.info(f"Exported {len(filtered_rows)} rows to {output_path}")
+        logger.info("Exported %s rows to %s", len(filtered_rows), output_path)
         return len(filtered_rows)
 
     def export_unmatched_only(self, output_path: Path) -> int:
@@ -175,5 +175,5 @@ class CSVExporter:
                     }
                 )
 
-        logger.info(f"Exported {len(unmatched)} unmatched rows to {output_path}")
+        logger.info("Exported %s unmatched rows to %s", len(unmatched), output_path)
         return len(unmatched)
@@ -111,7 +111,7 @@ class DSPyOptimizer:
         dspy.configure(lm=lm)
 
         self.matcher = MatchingModule()
-        logger.info(f"Initialized DSPy optimizer with model: {settings.llm_model}")
+        logger.info("Initialized DSPy optimizer with model: %s", settings.llm_model)
 
     def _format_content_summaries(self, content_items: list[WordPressContent]) -> str:
         """Format content items as indexed summaries for DSPy input.
@@ -164,7 +164,7 @@ class DSPyOptimizer:
                 # Load taxonomy page
                 taxonomy = self.db.get_taxonomy_by_id(matching.taxonomy_id)
                 if not taxonomy:
-                    logger.warning(f"Taxonomy {matching.taxonomy_id} not found, skipping")
+                    logger.warning("Taxonomy %s not found, skipping", matching.taxonomy_id)
                     continue
 
                 # Find the matched content item
@@ -173,7 +173,9 @@ class DSPyOptimizer:
                 )
                 if not matched_content:
                     logger.warning(
-                        f"Content {matching.content_id} not found for matching {matching.id}, skipping"
+                        "Content %s not found for matching %s, skipping",
+                        matching.content_id,
+                        matching.id,
                     )
                     continue
 
@@ -182,7 +184,8 @@ class DSPyOptimizer:
                     best_match_index = content_items.index(matched_content)
                 except ValueError:
                     logger.warning(
-                        f"Matched content {matching.content_id} not in content_items list, skipping"
+                        "Matched content %s not in content_items list, skipping",
+                        matching.content_id,
                     )
                     continue
 
@@ -211,10 +214,10 @@ class DSPyOptimizer:
                 examples.append(example)
 
             except Exception as e:
-                logger.error(f"Error preparing training example for matching {matching.id}: {e}")
+                logger.error("Error preparing training example for matching %s: %s", matching.id, e)
                 continue
 
-        logger.info(f"Prepared {len(examples)} training examples from matching results")
+        logger.info("Prepared %s training examples from matching results", len(examples))
         return examples
 
     def accuracy_metric(
@@ -320,14 +323,14 @@ class DSPyOptimizer:
                                 demo_dict["reasoning"] = str(demo.reasoning)
                             demonstrations.append(demo_dict)
                         except Exception as e:
-                            logger.warning(f"Could not serialize demonstration: {e}")
+                            logger.warning("Could not serialize demonstration: %s", e)
                             continue
 
             info["num_demos"] = str(num_demos)
             info["demonstrations"] = demonstrations
 
         except Exception as e:
-            logger.warning(f"Could not extract prompt info: {e}")
+            logger.warning("Could not extract prompt info: %s", e)
             info["error"] = str(e)
             info["num_demos"] = "0"
             info["demonstrations"] = []
@@ -366,7 +369,7 @@ class DSPyOptimizer:
             val_set = validation_examples
 
         logger.info(
-            f"Optimizing with {len(train_set)} training, {len(val_set)} validation examples"
+            "Optimizing with %s training, %s validation examples", len(train_set), len(val_set)
         )
 
         # Set up optimizer
@@ -392,12 +395,12 @@ class DSPyOptimizer:
             )
 
             score = evaluator(optimized)
-            logger.info(f"Optimized model validation score: {score:.3f}")
+            logger.info("Optimized model validation score: %.3f", score)
 
             return cast(MatchingModule, optimized)
 
         except Exception as e:
-            logger.error(f"Optimization failed: {e}")
+            logger.error("Optimization failed: %s", e)
             return self.matcher
 
     def generate_optimization_report(
@@ -586,7 +589,7 @@ class DSPyOptimizer:
                     # Skip invalid filenames
                     continue
         except Exception as e:
-            logger.warning(f"Error scanning for existing config files: {e}")
+            logger.warning("Error scanning for existing config files: %s", e)
 
         return max_version + 1
 
@@ -746,7 +749,7 @@ class DSPyOptimizer:
         with open(config_file, "w", encoding="utf-8") as f:
             json.dump(config, f, indent=2, ensure_ascii=False)
 
-        logger.info(f"Saved optimization config to {config_file}")
+        logger.info("Saved optimization config to %s", config_file)
         return config_file
 
     def save_optimized_model(self, model: MatchingModule, path: str) -> None:
@@ -759,13 +762,13 @@ class DSPyOptimizer:
         model_path = Path(path)
         model_path.parent.mkdir(parents=True, exist_ok=True)
         model.save(str(model_path))
-        logger.info(f"Saved optimized model to {model_path}")
+        logger.info("Saved optimized model to %s", model_path)
 
     def load_optimized_model(self, path: str) -> MatchingModule:
         """Load optimized model from a specific path."""
         model_path = Path(path)
         self.matcher.load(str(model_path))
-        logger.info(f"Loaded optimized model from {model_path}")
+        logger.info("Loaded optimized model from %s", model_path)
         return self.matcher
 
     def load_latest_model(self) -> MatchingModule | None:
@@ -797,7 +800,7 @@ class DSPyOptimizer:
             return None
 
         self.matcher.load(str(latest_path))
-        logger.info(f"Loaded latest optimized model from {latest_path}")
+        logger.info("Loaded latest optimized model from %s", latest_path)
         return self.matcher
 
     def predict_match(
@@ -880,7 +883,7 @@ class DSPyOptimizer:
                         )
                         examples.append(example)
                     except (KeyError, ValueError, TypeError) as e:
-                        logger.warning(f"Skipping invalid example at index {i}: {e}")
+                        logger.warning("Skipping invalid example at index %s: %s", i, e)
                         continue
 
         elif dataset_path.suffix.lower() == ".csv":
@@ -914,7 +917,7 @@ class DSPyOptimizer:
                         )
                         examples.append(example)
                     except (KeyError, ValueError, TypeError) as e:
-                        logger.warning(f"Skipping invalid row {i + 1}: {e}")
+                        logger.warning("Skipping invalid row %s: %s", i + 1, e)
                         continue
         else:
             raise ValueError(f"Unsupported file format: {dataset_path.suffix}. Use .csv or .json")
@@ -922,7 +925,7 @@ class DSPyOptimizer:
         if not examples:
             raise ValueError("No valid examples found in dataset file")
 
-        logger.info(f"Loaded {len(examples)} examples from {dataset_path}")
+        logger.info("Loaded %s examples from %s", len(examples), dataset_path)
         return examples
 
     def optimize_with_gepa(
@@ -963,7 +966,9 @@ class DSPyOptimizer:
             val_set = validation_examples
 
         logger.info(
-            f"Optimizing with GEPA: {len(train_set)} training, {len(val_set)} validation examples"
+            "Optimizing with GEPA: %s training, %s validation examples",
+            len(train_set),
+            len(val_set),
         )
 
         # Configure reflection LM
@@ -1032,12 +1037,12 @@ class DSPyOptimizer:
             )
 
             score = evaluator(optimized)
-            logger.info(f"GEPA optimized model validation score: {score:.3f}")
+            logger.info("GEPA optimized model validation score: %.3f", score)
 
             return cast(MatchingModule, optimized)
 
         except Exception as e:
-            logger.error(f"GEPA optimization failed: {e}")
+            logger.error("GEPA optimization failed: %s", e)
             return self.matcher
 
     def optimize_with_dataset(
@@ -1083,7 +1088,9 @@ class DSPyOptimizer:
                 val_set = validation_examples
 
             logger.info(
-                f"Optimizing with BootstrapFewShotWithRandomSearch: {len(train_set)} training, {len(val_set)} validation examples"
+                "Optimizing with BootstrapFewShotWithRandomSearch: %s training, %s validation examples",
+                len(train_set),
+                len(val_set),
             )
 
             optimizer = dspy_teleprompt.BootstrapFewShotWithRandomSearch(
@@ -1104,7 +1111,7 @@ class DSPyOptimizer:
                 return cast(MatchingModule, optimized)
 
             except Exception as e:
-                logger.error(f"BootstrapFewShotWithRandomSearch optimization failed: {e}")
+                logger.error("BootstrapFewShotWithRandomSearch optimization failed: %s", e)
                 return self.matcher
         else:  # bootstrap (existing method)
             max_bootstrapped = kwargs.get("max_bootstrapped_demos", 4)
@@ -51,7 +51,7 @@ class Evaluator:
             "low_confidence_count": sum(1 for c in confidences if c < 0.5),
         }
 
-        logger.info(f"Categorization evaluation: {metrics}")
+        logger.info("Categorization evaluation: %s", metrics)
         return metrics
 
     def evaluate_matching(self, results: list[MatchingResult]) -> dict[str, Any]:
@@ -84,7 +84,7 @@ class Evaluator:
             "max_similarity": max(similarities) if similarities else 0.0,
         }
 
-        logger.info(f"Matching evaluation: {metrics}")
+        logger.info("Matching evaluation: %s", metrics)
         return metrics
 
     def evaluate_all(self) -> dict[str, Any]:
@@ -138,7 +138,7 @@ class Evaluator:
             if m.content_id is not None and m.similarity_score < min_similarity
         ]
 
-        logger.info(f"Found {len(low_quality)} low-quality matches below {min_similarity}")
+        logger.info("Found %s low-quality matches below %s", len(low_quality), min_similarity)
         return low_quality
 
     def get_unmatched_taxonomy(self) -> list[MatchingResult]:
@@ -150,5 +150,5 @@ class Evaluator:
         all_matches = self.db.get_all_matchings()
         unmatched = [m for m in all_matches if m.content_id is None]
 
-        logger.info(f"Found {len(unmatched)} unmatched taxonomy pages")
+        logger.info("Found %s unmatched taxonomy pages", len(unmatched))
         return unmatched
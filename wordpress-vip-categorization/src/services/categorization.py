@@ -55,9 +55,9 @@ class CategorizationService:
             else:
                 logger.info("No optimized model found, using unoptimized DSPy module")
         except Exception as e:
-            logger.warning(f"Failed to load optimized model, using unoptimized: {e}")
+            logger.warning("Failed to load optimized model, using unoptimized: %s", e)
 
-        logger.info(f"Initialized categorization service with base URL: {settings.llm_base_url}")
+        logger.info("Initialized categorization service with base URL: %s", settings.llm_base_url)
 
     @staticmethod
     def _coerce_datetime(value: Any) -> datetime:
@@ -156,7 +156,7 @@ The confidence should be a number between 0 and 1.
             }
             requests.append(request)
 
-        logger.info(f"Prepared {len(requests)} batch requests")
+        logger.info("Prepared %s batch requests", len(requests))
         return requests
 
     def create_batch_file(self, requests: list[dict[str, Any]]) -> str:
@@ -173,7 +173,7 @@ The confidence should be a number between 0 and 1.
             for request in requests:
                 f.write(json.dumps(request) + "\n")
 
-        logger.info(f"Created batch file: {file_path}")
+        logger.info("Created batch file: %s", file_path)
         return str(file_path)
 
     @retry(
@@ -203,7 +203,7 @@ The confidence should be a number between 0 and 1.
             metadata={"description": description} if description else {},
         )
 
-        logger.info(f"Submitted batch {batch.id} with file {file_response.id}")
+        logger.info("Submitted batch %s with file %s", batch.id, file_response.id)
         return str(batch.id)
 
     def get_batch_status(self, batch_id: str) -> BatchJobStatus:
@@ -253,13 +253,13 @@ The confidence should be a number between 0 and 1.
         start_time = time.time()
         timeout = self.settings.llm_batch_timeout
 
-        logger.info(f"Waiting for batch {batch_id} to complete...")
+        logger.info("Waiting for batch %s to complete...", batch_id)
 
         while True:
             status = self.get_batch_status(batch_id)
 
             if status.status == "completed":
-                logger.info(f"Batch {batch_id} completed successfully")
+                logger.info("Batch %s completed successfully", batch_id)
                 return status
 
             if status.status == "failed":
@@ -273,9 +273,11 @@ The confidence should be a number between 0 and 1.
                 raise TimeoutError(f"Batch {batch_id} exceeded timeout of {timeout}s")
 
             logger.debug(
-                f"Batch {batch_id} status: {status.status} "
-                f"({status.request_counts.get('completed', 0)}/"
-                f"{status.request_counts.get('total', 0)} completed)"
+                "Batch %s status: %s (%s/%s completed)",
+                batch_id,
+                status.status,
+                status.request_counts.get("completed", 0),
+                status.request_counts.get("total", 0),
             )
 
             time.sleep(check_interval)
@@ -305,7 +307,7 @@ The confidence should be a number between 0 and 1.
             if line:
                 results.append(json.loads(line))
 
-        logger.info(f"Retrieved {len(results)} results from batch {batch_id}")
+        logger.info("Retrieved %s results from batch %s", len(results), batch_id)
         return results
 
     def parse_batch_results(
@@ -337,10 +339,10 @@ The confidence should be a number between 0 and 1.
                 categorizations.append(categorization)
 
             except Exception as e:
-                logger.error(f"Error parsing result for {result.get('custom_id')}: {e}")
+                logger.error("Error parsing result for %s: %s", result.get("custom_id"), e)
                 continue
 
-        logger.info(f"Parsed {len(categorizations)} categorization results")
+        logger.info("Parsed %s categorization results", len(categorizations))
         return categorizations
 
     def categorize_content_batch(
@@ -379,7 +381,7 @@ The confidence should be a number between 0 and 1.
             for cat in categorizations:
                 self.db.insert_categorization(cat)
 
-            logger.info(f"Stored {len(categorizations)} categorization results")
+            logger.info("Stored %s categorization results", len(categorizations))
 
         return batch_id
 
@@ -391,7 +393,7 @@ The confidence should be a number between 0 and 1.
         """
         taxonomy_pages = self.db.get_all_taxonomy()
         categories = list({page.category for page in taxonomy_pages})
-        logger.info(f"Found {len(categories)} categories in taxonomy")
+        logger.info("Found %s categories in taxonomy", len(categories))
         return categories
 
     def categorize_for_matching(
@@ -418,8 +420,10 @@ The confidence should be a number between 0 and 1.
                 - total: Total taxonomy pages processed
         """
         logger.info(
-            f"Starting LLM categorization for {len(taxonomy_pages)} taxonomy pages "
-            f"against {len(content_items)} content items (min confidence: {min_confidence})"
+            "Starting LLM categorization for %s taxonomy pages against %s content items (min confidence: %s)",
+            len(taxonomy_pages),
+            len(content_items),
+            min_confidence,
         )
 
         matched_count = 0
@@ -439,8 +443,10 @@ The confidence should be a number between 0 and 1.
                 )
                 matched_count += 1
                 logger.info(
-                    f"LLM matched taxonomy {taxonomy.url} to {best_match.url} "
-                    f"(confidence: {confidence:.3f})"
+                    "LLM matched taxonomy %s to %s (confidence: %.3f)",
+                    taxonomy.url,
+                    best_match.url,
+                    confidence,
                 )
             else:
                 # Below threshold or no match - needs human review
@@ -453,16 +459,19 @@ The confidence should be a number between 0 and 1.
                 )
                 below_threshold_count += 1
                 logger.warning(
-                    f"LLM match for taxonomy {taxonomy.url} below threshold "
-                    f"(confidence: {confidence if best_match else 0.0:.3f}, threshold: {min_confidence})"
+                    "LLM match for taxonomy %s below threshold (confidence: %.3f, threshold: %s)",
+                    taxonomy.url,
+                    confidence if best_match else 0.0,
+                    min_confidence,
                 )
 
             # Store result
             self.db.upsert_matching(matching_result)
 
         logger.info(
-            f"LLM categorization complete: {matched_count} matched, "
-            f"{below_threshold_count} need review"
+            "LLM categorization complete: %s matched, %s need review",
+            matched_count,
+            below_threshold_count,
         )
 
         return {
@@ -496,5 +505,5 @@ The confidence should be a number between 0 and 1.
                 return None, 0.0
 
         except Exception as e:
-            logger.error(f"Error in DSPy matching for taxonomy {taxonomy.url}: {e}")
+            logger.error("Error in DSPy matching for taxonomy %s: %s", taxonomy.url, e)
             raise  # Raise exception rather than falling back to hardcoded prompt
@@ -51,7 +51,7 @@ class IngestionService:
         total_ingested = 0
 
         for site_url in site_urls:
-            logger.info(f"Starting ingestion from {site_url}")
+            logger.info("Starting ingestion from %s", site_url)
 
             site_since = since
             if resume and site_since is None:
@@ -76,7 +76,7 @@ class IngestionService:
 
             # Test connection
             if not connector.test_connection():
-                logger.error(f"Failed to connect to {site_url}, skipping")
+                logger.error("Failed to connect to %s, skipping", site_url)
                 continue
 
             # Fetch and store content
@@ -90,12 +90,12 @@ class IngestionService:
                     self.db.upsert_content(content)
                     site_count += 1
                 except Exception as e:
-                    logger.error(f"Error storing content {content.url}: {e}")
+                    logger.error("Error storing content %s: %s", content.url, e)
 
-            logger.info(f"Ingested {site_count} items from {site_url}")
+            logger.info("Ingested %s items from %s", site_count, site_url)
             total_ingested += site_count
 
-        logger.info(f"Total ingestion completed: {total_ingested} items")
+        logger.info("Total ingestion completed: %s items", total_ingested)
         return total_ingested
 
     def load_taxonomy_from_csv(self, csv_path: Path) -> int:
@@ -137,9 +137,9 @@ class IngestionService:
                     count += 1
 
                 except Exception as e:
-                    logger.error(f"Error loading taxonomy row {row}: {e}")
+                    logger.error("Error loading taxonomy row %s: %s", row, e)
 
-        logger.info(f"Loaded {count} taxonomy pages from {csv_path}")
+        logger.info("Loaded %s taxonomy pages from %s", count, csv_path)
         return count
 
     def get_ingestion_stats(self) -> dict[str, int]:
@@ -155,5 +155,5 @@ class IngestionService:
             "matchings": len(self.db.get_all_matchings()),
         }
 
-        logger.info(f"Ingestion stats: {stats}")
+        logger.info("Ingestion stats: %s", stats)
         return stats
@@ -35,8 +35,9 @@ class MatchingService:
         )
         self.embedding_model = settings.semantic_embedding_model
         logger.info(
-            f"Initialized matching service with model: {self.embedding_model}, "
-            f"base URL: {settings.semantic_base_url}"
+            "Initialized matching service with model: %s, base URL: %s",
+            self.embedding_model,
+            settings.semantic_base_url,
         )
 
     @retry(
@@ -139,12 +140,17 @@ class MatchingService:
         # Sort by similarity descending
         matches.sort(key=lambda x: x[1], reverse=True)
 
-        logger.debug(
-            f"Matched taxonomy {taxonomy.url} to {len(matches)} content items. "
-            f"Best match score: {matches[0][1]:.3f}"
-            if matches
-            else "No matches found"
-        )
+        # Runs once per taxonomy page; skip building the arguments unless DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            if matches:
+                logger.debug(
+                    "Matched taxonomy %s to %s content items. Best match score: %.3f",
+                    taxonomy.url,
+                    len(matches),
+                    matches[0][1],
+                )
+            else:
+                logger.debug("No matches found")
 
         return matches
 
@@ -203,8 +209,10 @@ class MatchingService:
                 unmatched.append(taxonomy)
 
         logger.info(
-            f"Found {len(unmatched)}/{len(taxonomy_pages)} taxonomy pages "
-            f"below threshold {min_threshold}"
+            "Found %s/%s taxonomy pages below threshold %s",
+            len(unmatched),
+            len(taxonomy_pages),
+            min_threshold,
         )
 
         return unmatched
@@ -237,7 +245,9 @@ class MatchingService:
             content_items = self.db.get_all_content()
 
         logger.info(
-            f"Matching {len(taxonomy_pages)} taxonomy pages to {len(content_items)} content items"
+            "Matching %s taxonomy pages to %s content items",
+            len(taxonomy_pages),
+            len(content_items),
         )
 
         results: dict[UUID, MatchingResult] = {}
@@ -259,7 +269,7 @@ class MatchingService:
 
                 results[taxonomy.id] = matching_result
                 logger.info(
-                    f"Matched taxonomy {taxonomy.url} to {content.url} (score: {score:.3f})"
+                    "Matched taxonomy %s to %s (score: %.3f)", taxonomy.url, content.url, score
                 )
             else:
                 # Create result with no match
@@ -276,15 +286,16 @@ class MatchingService:
 
                 results[taxonomy.id] = matching_result
                 logger.warning(
-                    f"No match found for taxonomy {taxonomy.url} above threshold {min_threshold}"
+                    "No match found for taxonomy %s above threshold %s", taxonomy.url, min_threshold
                 )
 
         matched_count = len(
             [result for result in results.values() if result.content_id is not None]
         )
         logger.info(
-            f"Completed matching: {matched_count} "
-            f"out of {len(taxonomy_pages)} taxonomy pages matched"
+            "Completed matching: %s out of %s taxonomy pages matched",
+            matched_count,
+            len(taxonomy_pages),
         )
 
         return results
@@ -342,8 +353,9 @@ class MatchingService:
             content_items = self.db.get_all_content()
 
         logger.info(
-            f"Batch matching {len(taxonomy_pages)} taxonomy pages "
-            f"to {len(content_items)} content items"
+            "Batch matching %s taxonomy pages to %s content items",
+            len(taxonomy_pages),
+            len(content_items),
         )
 
         # Get all embeddings in batch
@@ -385,8 +397,10 @@ class MatchingService:
 
                 results[taxonomy.id] = matching_result
                 logger.info(
-                    f"Matched taxonomy {taxonomy.url} to {best_content.url} "
-                    f"(score: {best_score:.3f})"
+                    "Matched taxonomy %s to %s (score: %.3f)",
+                    taxonomy.url,
+                    best_content.url,
+                    best_score,
                 )
             else:
                 matching_result = MatchingResult(
@@ -402,16 +416,19 @@ class MatchingService:
 
                 results[taxonomy.id] = matching_result
                 logger.warning(
-                    f"No match found for taxonomy {taxonomy.url} "
-                    f"(best score: {best_score:.3f}, threshold: {min_threshold})"
+                    "No match found for taxonomy %s (best score: %.3f, threshold: %s)",
+                    taxonomy.url,
+                    best_score,
+                    min_threshold,
                 )
 
         matched_count = len(
             [result for result in results.values() if result.content_id is not None]
         )
         logger.info(
-            f"Completed batch matching: {matched_count}/{len(taxonomy_pages)} "
-            f"taxonomy pages matched"
+            "Completed batch matching: %s/%s taxonomy pages matched",
+            matched_count,
+            len(taxonomy_pages),
         )
 
         return results
@@ -46,9 +46,11 @@ class WorkflowService:
         )
 
         logger.info(
-            f"Initialized workflow service - "
-            f"Semantic: {settings.enable_semantic_matching} (threshold: {settings.similarity_threshold}), "
-            f"LLM: {settings.enable_llm_categorization} (threshold: {settings.llm_confidence_threshold})"
+            "Initialized workflow service - Semantic: %s (threshold: %s), LLM: %s (threshold: %s)",
+            settings.enable_semantic_matching,
+            settings.similarity_threshold,
+            settings.enable_llm_categorization,
+            settings.llm_confidence_threshold,
         )
 
     def run_matching_workflow(
@@ -97,8 +99,9 @@ class WorkflowService:
             content_items = self.db.get_all_content()
 
         logger.info(
-            f"Starting workflow with {len(taxonomy_pages)} taxonomy pages "
-            f"and {len(content_items)} content items"
+            "Starting workflow with %s taxonomy pages and %s content items",
+            len(taxonomy_pages),
+            len(content_items),
         )
 
         stats = {
@@ -113,7 +116,8 @@ class WorkflowService:
 
         if self.settings.enable_semantic_matching:
             logger.info(
-                f"Stage 1: Running semantic matching (threshold >= {self.settings.similarity_threshold})"
+                "Stage 1: Running semantic matching (threshold >= %s)",
+                self.settings.similarity_threshold,
             )
 
             # Run semantic matching for all taxonomy pages
@@ -133,8 +137,9 @@ class WorkflowService:
 
             stats["semantic_matched"] = len(taxonomy_pages) - len(unmatched_taxonomy)
             logger.info(
-                f"Semantic matching complete: {stats['semantic_matched']} matched, "
-                f"{len(unmatched_taxonomy)} unmatched"
+                "Semantic matching complete: %s matched, %s unmatched",
+                stats["semantic_matched"],
+                len(unmatched_taxonomy),
             )
         else:
             logger.info("Stage 1: Semantic matching disabled, skipping...")
@@ -143,8 +148,9 @@ class WorkflowService:
         # Stage 2: LLM Categorization Fallback
         if self.settings.enable_llm_categorization and unmatched_taxonomy:
             logger.info(
-                f"Stage 2: Running LLM categorization for {len(unmatched_taxonomy)} unmatched items "
-                f"(confidence >= {self.settings.llm_confidence_threshold})"
+                "Stage 2: Running LLM categorization for %s unmatched items (confidence >= %s)",
+                len(unmatched_taxonomy),
+                self.settings.llm_confidence_threshold,
             )
 
             # Run LLM categorization for unmatched items
@@ -158,8 +164,9 @@ class WorkflowService:
             stats["needs_review"] = llm_results.get("below_threshold", 0)
 
             logger.info(
-                f"LLM categorization complete: {stats['llm_categorized']} matched, "
-                f"{stats['needs_review']} need review"
+                "LLM categorization complete: %s matched, %s need review",
+                stats["llm_categorized"],
+                stats["needs_review"],
             )
         elif not self.settings.enable_llm_categorization:
             logger.info("Stage 2: LLM categorization disabled, skipping...")
@@ -169,10 +176,10 @@ class WorkflowService:
 
         # Log final summary
         logger.info(
-            f"Workflow complete - "
-            f"Semantic: {stats['semantic_matched']}, "
-            f"LLM: {stats['llm_categorized']}, "
-            f"Review: {stats['needs_review']}"
+            "Workflow complete - Semantic: %s, LLM: %s, Review: %s",
+            stats["semantic_matched"],
+            stats["llm_categorized"],
+            stats["needs_review"],
         )
 
         return stats